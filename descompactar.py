@@ -1,5 +1,321 @@
+import asyncio
+import multiprocessing
 import os
+import re
+import shutil
+import struct
 import subprocess
+import threading
+import zipfile
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+try:
+    import libarchive  # python-libarchive-c, opcional
+except ImportError:
+    libarchive = None
+
+RAR_SUFFIX = ".rar"
+ARCHIVE_RE = re.compile(r"\.(zip|rar)\Z", re.IGNORECASE)
+# Arquivos até este tamanho vão para a fila rápida (threads)
+SMALL_ARCHIVE_SIZE = 1 << 20
+# Tamanho do buffer de leitura/gravação das entradas do ZIP
+COPY_BUFFER_SIZE = 1 << 20
+# Caracteres inválidos em nomes de arquivo no Windows, trocados por "_"
+_WINDOWS_ILEGAIS = str.maketrans(':<>|"?*', "_" * 7)
+# No Windows o WinRAR roda com prioridade abaixo do normal para não
+# atrasar a varredura; nos outros sistemas o valor precisa ser 0
+_CREATIONFLAGS = getattr(subprocess, "BELOW_NORMAL_PRIORITY_CLASS", 0)
+# Arquivo vazio criado ao lado de cada arquivo compactado já descompactado
+MARKER_SUFFIX = ".extracted"
+
+def _ja_descompactado(caminho_completo, mtime):
+    """Indica se o arquivo já foi descompactado depois da sua última alteração."""
+    try:
+        return os.stat(caminho_completo + MARKER_SUFFIX).st_mtime >= mtime
+    except OSError:
+        return False
+
+def _marcar_descompactado(caminho_completo):
+    """Cria (ou atualiza) o marcador de descompactação concluída."""
+    open(caminho_completo + MARKER_SUFFIX, "wb").close()
+
+def _comando_winrar(caminho_completo, pasta_atual, threads=1):
+    """
+    Monta a linha de comando do WinRAR para descompactar na pasta indicada.
+
+    Args:
+        caminho_completo (str): O caminho do arquivo compactado ou uma máscara.
+        pasta_atual (str): A pasta de destino.
+        threads (int): Threads que o WinRAR pode usar (-mt).
+    """
+    # -r- evita que a máscara seja aplicada nas subpastas; -ri1:10 baixa a
+    # prioridade de E/S; o separador final indica ao WinRAR que o último
+    # argumento é a pasta de destino
+    return ["winrar", "x", "-o+", "-r-", f"-mt{threads}", "-ri1:10",
+            caminho_completo, pasta_atual + os.sep]
+
+def _extract_one(caminho_completo, pasta_atual):
+    """
+    Descompacta com o WinRAR um arquivo (ou máscara de arquivos) na pasta indicada.
+
+    Args:
+        caminho_completo (str): O caminho do arquivo compactado ou uma máscara, ex: pasta\\*.rar.
+        pasta_atual (str): A pasta de destino.
+    """
+    print(f"Descompactando: {caminho_completo}")
+    resultado = subprocess.run(_comando_winrar(caminho_completo, pasta_atual),
+                               check=False, stdout=subprocess.DEVNULL, shell=False,
+                               creationflags=_CREATIONFLAGS)
+    return resultado.returncode
+
+async def _extract_winrar_async(jobs):
+    """
+    Descompacta com o WinRAR vários arquivos ao mesmo tempo, sem bloquear
+    o interpretador enquanto cada processo termina.
+
+    Args:
+        jobs (list): Tuplas (caminho ou máscara, pasta de destino, arquivos
+            que são marcados como descompactados se o WinRAR terminar sem erro).
+    """
+    cpus = os.cpu_count() or 1
+    simultaneos = max(1, min(cpus, len(jobs)))
+    limite = asyncio.Semaphore(simultaneos)
+    # Dividir os núcleos entre os processos para não sobrecarregar a CPU
+    threads = max(1, cpus // simultaneos)
+
+    async def _extract(caminho_completo, pasta_atual, arquivos):
+        async with limite:
+            print(f"Descompactando: {caminho_completo}")
+            proc = await asyncio.create_subprocess_exec(
+                *_comando_winrar(caminho_completo, pasta_atual, threads),
+                stdout=asyncio.subprocess.DEVNULL, creationflags=_CREATIONFLAGS)
+            returncode = await proc.wait()
+        if returncode == 0:
+            for arquivo in arquivos:
+                _marcar_descompactado(arquivo)
+        return returncode
+
+    return await asyncio.gather(*(_extract(*job) for job in jobs))
+
+def _caminho_destino(nome, destino):
+    """
+    Monta o caminho de destino de uma entrada do arquivo compactado, descartando unidades,
+    caminhos absolutos, componentes '..' e, no Windows, caracteres inválidos,
+    como o zipfile faz.
+
+    Args:
+        nome (str): O nome da entrada dentro do arquivo compactado.
+        destino (str): A pasta de destino.
+    """
+    nome = nome.replace("/", os.sep)
+    if os.altsep:
+        nome = nome.replace(os.altsep, os.sep)
+    nome = os.path.splitdrive(nome)[1]
+    partes = [p for p in nome.split(os.sep) if p not in ("", os.curdir, os.pardir)]
+    if os.sep == "\\":
+        partes = [p.translate(_WINDOWS_ILEGAIS).rstrip(".") for p in partes]
+        partes = [p for p in partes if p]
+    return os.path.join(destino, *partes)
+
+def _prefetch(caminho_completo):
+    """Pede ao sistema que comece a ler o arquivo em segundo plano (apenas POSIX)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(caminho_completo, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+def _copy_stored(caminho_completo, info, alvo):
+    """
+    Copia uma entrada sem compressão direto do ZIP para o destino com
+    os.copy_file_range e confere o CRC-32 do arquivo gravado.
+
+    Args:
+        caminho_completo (str): O caminho do arquivo ZIP.
+        info (zipfile.ZipInfo): A entrada a ser copiada.
+        alvo (str): O caminho do arquivo de destino.
+    """
+    with open(caminho_completo, "rb") as src, open(alvo, "w+b") as dst:
+        # Os dados começam depois do cabeçalho local, cujo tamanho varia
+        src.seek(info.header_offset)
+        cabecalho = struct.unpack(zipfile.structFileHeader, src.read(zipfile.sizeFileHeader))
+        if cabecalho[0] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Cabeçalho local inválido: {info.filename}")
+        posicao = info.header_offset + zipfile.sizeFileHeader + cabecalho[10] + cabecalho[11]
+
+        restante = info.file_size
+        while restante:
+            copiados = os.copy_file_range(src.fileno(), dst.fileno(), restante, posicao)
+            if copiados == 0:
+                raise zipfile.BadZipFile(f"Entrada truncada: {info.filename}")
+            posicao += copiados
+            restante -= copiados
+
+        # O kernel não confere o CRC-32 como o zipfile faz; o arquivo recém
+        # gravado ainda está no cache, então a releitura é barata
+        dst.seek(0)
+        crc = 0
+        for bloco in iter(lambda: dst.read(COPY_BUFFER_SIZE), b""):
+            crc = zlib.crc32(bloco, crc)
+        if crc != info.CRC:
+            raise zipfile.BadZipFile(f"CRC-32 inválido: {info.filename}")
+
+def _extract_zip_parallel(caminho_completo, pasta_atual):
+    """
+    Descompacta as entradas de um arquivo ZIP em paralelo, uma por thread.
+
+    Cada thread abre o seu próprio ZipFile, com posição de leitura
+    independente; o zlib libera o GIL durante a descompactação.
+
+    Args:
+        caminho_completo (str): O caminho do arquivo ZIP.
+        pasta_atual (str): A pasta de destino.
+    """
+    with zipfile.ZipFile(caminho_completo) as zf:
+        infos = zf.infolist()
+
+    # Com a leitura antecipada, as threads encontram os dados compactados
+    # de todas as entradas já a caminho do cache
+    _prefetch(caminho_completo)
+
+    # Criar todas as pastas de destino uma única vez, antes de iniciar as
+    # threads; assim as threads só abrem e gravam arquivos
+    alvos = {info.filename: _caminho_destino(info.filename, pasta_atual) for info in infos}
+    pastas = {alvos[i.filename] if i.is_dir() else os.path.dirname(alvos[i.filename]) for i in infos}
+    for pasta in sorted(pastas, key=len):
+        os.makedirs(pasta, exist_ok=True)
+
+    local = threading.local()
+    abertos = []
+
+    def _extract_one_entry(info):
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(caminho_completo)
+            abertos.append(zf)
+
+        alvo = alvos[info.filename]
+
+        # Entradas sem compressão nem criptografia são copiadas pelo kernel
+        if (info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1
+                and hasattr(os, "copy_file_range")):
+            try:
+                _copy_stored(caminho_completo, info, alvo)
+                return
+            except OSError:
+                pass  # ex: sistema de arquivos sem suporte; segue pelo zipfile
+        with zf.open(info) as src, open(alvo, "wb", buffering=COPY_BUFFER_SIZE) as dst:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as tp:
+            list(tp.map(_extract_one_entry, [i for i in infos if not i.is_dir()]))
+    finally:
+        for zf in abertos:
+            zf.close()
+
+def _extract_zip(caminho_completo, pasta_atual):
+    """
+    Descompacta um arquivo ZIP no próprio processo, sem chamar o WinRAR.
+
+    Arquivos que o zipfile não reconhece (autoextraíveis, divididos) ou não
+    consegue extrair (criptografados, métodos como Deflate64) são repassados
+    para o WinRAR. Erros de E/S são informados sem interromper os demais arquivos.
+
+    Args:
+        caminho_completo (str): O caminho do arquivo ZIP.
+        pasta_atual (str): A pasta de destino.
+    """
+    print(f"Descompactando: {caminho_completo}")
+    try:
+        _extract_zip_parallel(caminho_completo, pasta_atual)
+    except (zipfile.BadZipFile, RuntimeError, NotImplementedError):
+        # RuntimeError: entrada criptografada; NotImplementedError: método sem suporte
+        if _extract_one(caminho_completo, pasta_atual) != 0:
+            return
+    except OSError as e:
+        print(f"Erro ao descompactar {caminho_completo}: {e}")
+        return
+    _marcar_descompactado(caminho_completo)
+
+def _extract_libarchive(caminho_completo, pasta_atual):
+    """
+    Descompacta um arquivo RAR no próprio processo com a libarchive.
+
+    Arquivos que a libarchive não consegue ler (ex: criptografados) são
+    repassados para o WinRAR. Erros de E/S são informados sem interromper os demais arquivos.
+
+    Args:
+        caminho_completo (str): O caminho do arquivo RAR.
+        pasta_atual (str): A pasta de destino.
+    """
+    print(f"Descompactando: {caminho_completo}")
+    try:
+        with libarchive.file_reader(caminho_completo) as arquivo:
+            for entry in arquivo:
+                alvo = _caminho_destino(entry.pathname, pasta_atual)
+                if entry.isdir:
+                    os.makedirs(alvo, exist_ok=True)
+                elif entry.isfile:
+                    os.makedirs(os.path.dirname(alvo), exist_ok=True)
+                    with open(alvo, "wb", buffering=COPY_BUFFER_SIZE) as dst:
+                        for bloco in entry.get_blocks():
+                            dst.write(bloco)
+    except libarchive.ArchiveError:
+        if _extract_one(caminho_completo, pasta_atual) != 0:
+            return
+    except OSError as e:
+        print(f"Erro ao descompactar {caminho_completo}: {e}")
+        return
+    _marcar_descompactado(caminho_completo)
+
+def _executar(funcao, jobs):
+    """
+    Executa a função de descompactação em paralelo, aguardando todos terminarem.
+
+    Os arquivos pequenos vão para uma pool de threads e os grandes para uma
+    pool de processos, para que um arquivo de vários GB não atrase os pequenos.
+
+    Args:
+        funcao (callable): A função que descompacta um job (caminho, pasta).
+        jobs (list): Tuplas (caminho, pasta, tamanho em bytes).
+    """
+    if not jobs:
+        return
+    workers = os.cpu_count() or 1
+    # spawn: a pool criada por fork enquanto as threads da fila rápida
+    # rodam pode herdar um lock travado (ex: o do stdout)
+    with ThreadPoolExecutor(max_workers=workers * 2) as rapida, \
+            ProcessPoolExecutor(max_workers=workers,
+                                mp_context=multiprocessing.get_context("spawn")) as lenta:
+        futuros = [(rapida if tamanho <= SMALL_ARCHIVE_SIZE else lenta).submit(funcao, caminho, pasta)
+                   for caminho, pasta, tamanho in jobs]
+        wait(futuros)
+    for futuro in futuros:
+        futuro.result()  # Propaga erros das tarefas
+
+def _iter_arquivos(pasta):
+    """Percorre a pasta recursivamente com os.scandir, devolvendo os arquivos como DirEntry."""
+    try:
+        it = os.scandir(pasta)
+    except OSError as e:
+        # Pastas sem permissão (ex: System Volume Information) ou removidas
+        # durante a varredura são puladas, como o os.walk fazia
+        print(f"Erro ao listar {pasta}: {e}")
+        return
+    with it:
+
+        for entry in it:
+            # is_dir()/is_file() usam o d_type da listagem, sem stat extra.
+            # Links para pastas, links quebrados e FIFOs não são devolvidos
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_arquivos(entry.path)
+            elif entry.is_file():
+                yield entry
 
 def descompactar_arquivos(pasta_raiz):
     """
@@ -9,19 +325,51 @@ def descompactar_arquivos(pasta_raiz):
         pasta_raiz (str): O caminho da pasta onde os arquivos serão descompactados.
     """
 
-    for pasta_atual, _, arquivos in os.walk(pasta_raiz):
-        for arquivo in arquivos:
-            caminho_completo = os.path.join(pasta_atual, arquivo)
+    # Agrupar os arquivos compactados por tipo e pasta numa única varredura.
+    # O tipo encontrado pela regex escolhe o agrupamento direto no dict,
+    # sem testar cada extensão em sequência
+    por_tipo = {"zip": defaultdict(list), "rar": defaultdict(list)}
+    for entry in _iter_arquivos(pasta_raiz):
+        # A regex ignora maiúsculas, reconhecendo também .ZIP e .RAR
+        m = ARCHIVE_RE.search(entry.name)
+        if not m:
+            continue
+        stat = entry.stat(follow_symlinks=False)
+        # Os que já foram descompactados numa execução anterior ficam marcados
+        pendente = not _ja_descompactado(entry.path, stat.st_mtime)
+        por_tipo[m.group(1).lower()][os.path.dirname(entry.path)].append(
+            (entry.path, stat.st_size, pendente))
+    rars_por_pasta = por_tipo["rar"]
+
+    # Cada ZIP é descompactado pelo zipfile, no próprio processo
+    zips = [(caminho, pasta_atual, tamanho)
+            for pasta_atual, arquivos in por_tipo["zip"].items()
+            for caminho, tamanho, pendente in arquivos
+            if pendente]
+
+    # Duas etapas: todos os ZIP terminam (o pool aguarda no shutdown) antes
+    # que qualquer RAR comece, inclusive nas pastas que têm os dois tipos
+    _executar(_extract_zip, zips)
 
-            # Descompactar arquivos ZIP
-            if arquivo.endswith(".zip"):
-                print(f"Descompactando: {caminho_completo}")
-                subprocess.run(["winrar", "x", "-o+", caminho_completo, pasta_atual])  # Descompacta na mesma pasta
+    if libarchive is not None:
+        # Com a libarchive os RAR também são descompactados no próprio
+        # processo, um a um, como os ZIP
+        _executar(_extract_libarchive, [(caminho, pasta_atual, tamanho)
+                                        for pasta_atual, arquivos in rars_por_pasta.items()
+                                        for caminho, tamanho, pendente in arquivos
+                                        if pendente])
+        return
 
-            # Descompactar arquivos RAR (após descompactar os ZIPs)
-            elif arquivo.endswith(".rar") and not any(f.endswith(".zip") for f in os.listdir(pasta_atual)):
-                print(f"Descompactando: {caminho_completo}")
-                subprocess.run(["winrar", "x", "-o+", caminho_completo, pasta_atual])
+    # Sem a libarchive, os RAR usam uma única chamada do WinRAR por pasta.
+    # A máscara não permite escolher arquivos, então a pasta é refeita
+    # inteira se houver algum RAR pendente, e pulada se todos já estiverem
+    # descompactados
+    rars = [(os.path.join(pasta_atual, "*" + RAR_SUFFIX), pasta_atual,
+             [caminho for caminho, _, _ in arquivos])
+            for pasta_atual, arquivos in rars_por_pasta.items()
+            if any(pendente for _, _, pendente in arquivos)]
+    if rars:
+        asyncio.run(_extract_winrar_async(rars))
 
 if __name__ == "__main__":
     pasta_a_descompactar = input("Digite o caminho da pasta (ex: c:\\pasta\\): ")
@@ -5,17 +5,270 @@ Varre volumes de rede e organiza arquivos por categoria (fotos, ebooks, filmes,
 """
 
 import os
+import sys
+import errno
+import time
 import json
 import csv
+import glob
 from pathlib import Path
 from datetime import datetime
 import hashlib
+import mmap
 from collections import defaultdict, Counter
+from itertools import islice
+from contextlib import contextmanager
+from dataclasses import dataclass, astuple
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 import openpyxl  # Adicione este import no topo do arquivo
 
+try:
+    import blake3  # Opcional: hash paralelo com SIMD, bem mais rápido que o hashlib
+except ImportError:
+    blake3 = None
+
+# Algoritmo dos hashes; registrado nas saídas, pois os digests dos dois não são comparáveis
+HASH_ALGORITHM = 'blake3' if blake3 is not None else 'blake2b'
+
+# Arquivos maiores que isso usam todas as threads do BLAKE3
+BLAKE3_MULTITHREAD_SIZE = 256 * 1024 * 1024
+
+HASH_CHUNKSIZE = 64  # Arquivos enviados por vez a cada processo de hash
+HASH_BATCH = 4096  # Registros lidos do catálogo em disco por rodada de hash
+
+KERNEL_COPY_CHUNK = 1024 * 1024 * 1024  # Bytes por chamada de copy_file_range (mantém a cópia interrompível)
+
+ORGANIZE_WAVE = 1024  # Cópias enviadas por vez ao executor de organize_files
+
+PROGRESS_INTERVAL = 1000  # Arquivos entre mensagens de progresso
+VERBOSE_BATCH = 256  # Linhas do modo verbose escritas de uma vez
+
+# Outside Windows directories are listed through an open descriptor, so each
+# entry's stat is resolved relative to it instead of re-walking the full path
+_USE_DIR_FD = sys.platform != 'win32' and os.scandir in os.supports_fd
+
+@contextmanager
+def _scandir(path):
+    """os.scandir(path), sobre um descritor do diretório quando a plataforma permite
+    
+    Neste caso DirEntry.path contém apenas o nome; use os.path.join(path, entry.name).
+    """
+    if not _USE_DIR_FD:
+        with os.scandir(path) as it:
+            yield it
+        return
+    
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+    try:
+        with os.scandir(fd) as it:
+            yield it
+    finally:
+        # DirEntry.stat() uses this descriptor, so it stays open until the listing is done
+        os.close(fd)
+
+def _extension(name):
+    """Extensão em minúsculas do nome do arquivo, com as mesmas regras de Path.suffix"""
+    base, dot, ext = name.rpartition('.')
+    # Interned: only a few dozen distinct values, shared by every record.
+    # "file." and ".hidden" have no suffix, as with Path.suffix
+    return sys.intern(f".{ext.lower()}") if base and ext else ''
+
+def _hash_file(file_path, chunk_size=1024 * 1024):
+    """Digest BLAKE3 (ou BLAKE2b) de um arquivo; módulo-nível para rodar em outros processos"""
+    try:
+        with open(file_path, "rb") as f:
+            if blake3 is not None:
+                size = os.fstat(f.fileno()).st_size
+                threads = blake3.blake3.AUTO if size > BLAKE3_MULTITHREAD_SIZE else 1
+                hasher = blake3.blake3(max_threads=threads)
+                if size:  # mmap não aceita arquivos vazios
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        hasher.update(m)
+                return hasher.digest()
+            
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'blake2b').digest()
+            
+            hasher = hashlib.blake2b()
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                hasher.update(chunk)
+            return hasher.digest()
+    except Exception as e:
+        return None
+
+def _prefetch(file_path):
+    """Pede ao kernel que comece a ler o arquivo em segundo plano (apenas Linux)"""
+    try:
+        try:
+            # O_NOATIME only works on files we own
+            fd = os.open(file_path, os.O_RDONLY | os.O_NOATIME)
+        except PermissionError:
+            fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Only a hint; the copy itself reports the error
+
+def _scope_volumes(volumes):
+    """Volumes como caminhos absolutos, resolvidos como as raízes da varredura"""
+    return sorted(str(Path(v).resolve()) for v in volumes)
+
+def _folders_list_scope(list_file):
+    """Lê do cabeçalho de uma lista de pastas os volumes e o filtro; None se não os registrou"""
+    volumes = None
+    file_type_filter = None
+    try:
+        with open(list_file, encoding='utf-8') as f:
+            for line in f:
+                if not line.startswith('#'):
+                    break
+                line = line.rstrip('\r\n')
+                if line.startswith('# Volumes: '):
+                    volumes = json.loads(line[len('# Volumes: '):])
+                elif line.startswith('# Filtro aplicado: '):
+                    file_type_filter = line[len('# Filtro aplicado: '):]
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+    if volumes is None:
+        return None  # Older lists don't say what they cover
+    return volumes, file_type_filter
+
+def _kernel_copy(src, dst):
+    """Copia o conteúdo de src para dst dentro do kernel com os.copy_file_range
+    
+    Em btrfs/xfs a cópia pode virar um reflink. Cai para shutil.copyfile quando
+    a chamada não existe ou não é suportada entre os dois sistemas de arquivos.
+    """
+    if hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), KERNEL_COPY_CHUNK):
+                    pass
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+    # copyfile rewrites dst from scratch, so a partial kernel copy does no harm
+    shutil.copyfile(src, dst)
+
+def _move_file(src, dst, same_device):
+    """Move um arquivo conforme o volume de origem e destino
+    
+    same_device: True (mesmo volume, os.rename), False (outro volume, cópia no
+    kernel + remoção) ou None (desconhecido, shutil.move decide).
+    """
+    if same_device:
+        try:
+            os.rename(src, dst)
+            return
+        except OSError as e:
+            # Bind mounts share st_dev but still refuse a rename across them
+            if e.errno != errno.EXDEV:
+                raise
+    elif same_device is False and not os.path.islink(src):
+        _kernel_copy(src, dst)
+        shutil.copystat(src, dst)
+        os.unlink(src)
+        return
+    shutil.move(str(src), str(dst))
+
+def _syncfs(path):
+    """Grava em disco, com uma única chamada syncfs, tudo o que está pendente no volume de path (Linux)"""
+    if sys.platform != 'linux':
+        return
+    import ctypes  # Only needed here; syncfs has no wrapper in os
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        ctypes.CDLL(None, use_errno=True).syncfs(fd)
+    except (OSError, AttributeError):
+        pass
+    finally:
+        os.close(fd)
+
+def _print_line(line):
+    """print() em uma única escrita, para linhas vindas de várias threads não se misturarem"""
+    sys.stdout.write(line + '\n')
+
+@dataclass(slots=True)
+class FileRecord:
+    """Dados de um arquivo catalogado (mtime/ctime em segundos desde a época)"""
+    path: str
+    name: str
+    size: int
+    mtime: float
+    ctime: float
+    extension: str
+    parent_dir: str
+    category: str
+    hash: bytes | None = None  # Digest bruto; convertido para hex só na saída
+    dev: int = 0  # st_dev do volume (0 quando desconhecido, como no Windows)
+    
+    def to_json(self):
+        """Dicionário no formato do catálogo JSON, com as datas em ISO 8601"""
+        data = {
+            'path': self.path,
+            'name': self.name,
+            'size': self.size,
+            'modified': datetime.fromtimestamp(self.mtime).isoformat(),
+            'created': datetime.fromtimestamp(self.ctime).isoformat(),
+            'extension': self.extension,
+            'parent_dir': self.parent_dir,
+        }
+        if self.hash is not None:
+            data['hash'] = self.hash.hex()
+        data['category'] = self.category
+        return data
+
+class CatalogSink:
+    """Grava os arquivos catalogados em disco (JSON Lines, um arquivo temporário por categoria)"""
+    
+    def __init__(self):
+        self._dir = tempfile.mkdtemp(prefix='catalog_')
+        self._files = {}
+    
+    def write(self, file_info):
+        """Grava um arquivo no fim da sua categoria"""
+        category = file_info.category
+        f = self._files.get(category)
+        if f is None:
+            # Names that aren't valid UTF-8 (e.g. SMB mounts with the wrong charset) hold
+            # surrogates; surrogateescape writes them back as the original bytes
+            f = self._files[category] = open(os.path.join(self._dir, f"{category}.jsonl"), 'w+',
+                                             encoding='utf-8', errors='surrogateescape')
+        # The digest (bytes) is stored as hex and decoded again on read
+        f.write(json.dumps(astuple(file_info), ensure_ascii=False, default=bytes.hex))
+        f.write('\n')
+    
+    def iter_category(self, category):
+        """Lê de volta, em ordem, os arquivos gravados de uma categoria"""
+        f = self._files.get(category)
+        if f is None:
+            return
+        f.flush()
+        with open(f.name, 'r', encoding='utf-8', errors='surrogateescape') as reader:
+            for line in reader:
+                record = FileRecord(*json.loads(line))
+                if record.hash is not None:
+                    record.hash = bytes.fromhex(record.hash)
+                yield record
+    
+    def close(self):
+        """Fecha e remove os arquivos temporários"""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+        shutil.rmtree(self._dir, ignore_errors=True)
+
 class FileCataloger:
-    def __init__(self, verbose=False, exclude_paths=None):
+    def __init__(self, verbose=False, exclude_paths=None, stream_catalog=False):
         # Definir extensões por categoria
         self.categories = {
             'fotos': {
@@ -40,17 +293,28 @@ class FileCataloger:
             'outros': set()  # Para arquivos que não se encaixam nas categorias acima
         }
         
+        # Mapa invertido extensão -> categoria, para categorizar com um único lookup
+        self._ext_to_category = {ext: cat for cat, exts in self.categories.items() for ext in exts}
+        
         self.catalog = defaultdict(list)
+        # When streaming, files go to disk as they are found instead of self.catalog,
+        # keeping memory flat on huge scans (organize_files needs the in-memory catalog)
+        self.sink = CatalogSink() if stream_catalog else None
         self.stats = Counter()
         self.errors = []
         self.verbose = verbose
         self.exclude_paths = set()
         self.folders_with_files = set()  # Track folders containing matching files
+        self._catalog_lock = threading.Lock()  # Protects catalog/stats during parallel scans
+        self._next_progress = PROGRESS_INTERVAL
+        self._filter_category = None  # Categoria do filtro da varredura atual
+        self._progress_lines = []  # Verbose lines waiting to be written
+        self._writable_dirs = {}  # Cache de os.access durante organize_files
         
         if exclude_paths:
             # Convert to absolute paths and normalize
             for path in exclude_paths:
-                abs_path = Path(path).resolve()
+                abs_path = str(Path(path).resolve())
                 self.exclude_paths.add(abs_path)
                 if self.verbose:
                     print(f"Excluindo da busca: {abs_path}")
@@ -58,161 +322,263 @@ class FileCataloger:
         # Load folder exclusions from file if it exists
         self._load_folder_exclusions()
         
+        # Normalized string forms of the exclusions, so checks are plain string compares
+        self._exclude_exact = set(self.exclude_paths)
+        self._exclude_prefixes = tuple(p if p.endswith(os.sep) else p + os.sep
+                                       for p in self._exclude_exact)
+        
         self.operation_stats = {
             'successful_operations': 0,
             'failed_operations': 0,
             'skipped_operations': 0
         }
     
-    def get_file_info(self, file_path):
-        """Coleta informações detalhadas do arquivo"""
+    def get_file_info(self, entry, parent_dir=None, extension=None, category=None, path=None):
+        """Coleta informações detalhadas do arquivo a partir de um os.DirEntry"""
+        if path is None:
+            path = entry.path
         try:
-            stat = file_path.stat()
-            return {
-                'path': str(file_path),
-                'name': file_path.name,
-                'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                'extension': file_path.suffix.lower(),
-                'parent_dir': str(file_path.parent)
-            }
+            stat = entry.stat()
+            name = entry.name
+            if extension is None:
+                extension = _extension(name)
+            return FileRecord(
+                path=path,
+                name=name,
+                size=stat.st_size,
+                # Raw timestamps; formatted only when the catalog is written
+                mtime=stat.st_mtime,
+                ctime=stat.st_ctime,
+                extension=extension,
+                parent_dir=parent_dir if parent_dir is not None else os.path.dirname(path),
+                category=category if category is not None else self.categorize_file(name, extension),
+                dev=stat.st_dev
+            )
         except Exception as e:
-            self.errors.append(f"Erro ao acessar {file_path}: {str(e)}")
+            self.errors.append(f"Erro ao acessar {path}: {str(e)}")
             return None
     
-    def get_file_hash(self, file_path, chunk_size=8192):
-        """Calcula hash MD5 do arquivo (opcional, para detectar duplicatas)"""
-        try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except Exception as e:
-            return None
+    def get_file_hash(self, file_path, chunk_size=1024 * 1024):
+        """Calcula hash do arquivo para detectar duplicatas (BLAKE3 se instalado, senão BLAKE2b)
+        
+        Retorna o digest em bytes, ou None se o arquivo não puder ser lido.
+        """
+        return _hash_file(file_path, chunk_size)
     
-    def categorize_file(self, file_path):
+    def categorize_file(self, file_path, extension=None):
         """Determina a categoria do arquivo baseado na extensão"""
-        extension = file_path.suffix.lower()
-        
-        for category, extensions in self.categories.items():
-            if extension in extensions:
-                return category
-        
-        return 'outros'
+        if extension is None:
+            extension = Path(file_path).suffix.lower()
+        return self._ext_to_category.get(extension, 'outros')
     
-    def scan_directory(self, directory_path, include_hash=False, max_depth=None, file_type_filter=None):
-        """Varre um diretório recursivamente"""
+    def _prepare_scan(self, directory_path, file_type_filter=None):
+        """Valida o diretório e exibe o cabeçalho da varredura; retorna as extensões do filtro"""
         directory = Path(directory_path)
         
         if not directory.exists():
             print(f"Diretório não encontrado: {directory_path}")
-            return
+            return False
         
         if self.verbose:
             print(f"Iniciando varredura detalhada: {directory_path}")
         else:
             print(f"Varrendo: {directory_path}")
         
+        # Filtrar extensões por tipo de arquivo se especificado
+        target_extensions = None
+        self._filter_category = None
+        if file_type_filter and file_type_filter.lower() in self.categories:
+            # Every file that passes the filter belongs to this category
+            self._filter_category = file_type_filter.lower()
+            target_extensions = frozenset(self.categories[self._filter_category])
+            if self.verbose:
+                print(f"Filtrando apenas arquivos do tipo: {file_type_filter} ({len(target_extensions)} extensões)")
+                print(f"Extensões aceitas: {', '.join(sorted(target_extensions))}")
+            else:
+                print(f"Filtrando apenas arquivos do tipo: {file_type_filter} ({len(target_extensions)} extensões)")
+        
+        return target_extensions
+    
+    def _build_file_info(self, name, entry, parent_path, target_extensions, include_hash):
+        """Monta as informações de um arquivo encontrado na varredura (None se ignorado)"""
+        # Skip files that don't match the filter type
+        extension = _extension(name)
+        if target_extensions and extension not in target_extensions:
+            return None
+            
+        file_path = os.path.join(parent_path, name)
         try:
-            # Filtrar extensões por tipo de arquivo se especificado
-            target_extensions = None
-            if file_type_filter and file_type_filter.lower() in self.categories:
-                target_extensions = self.categories[file_type_filter.lower()]
-                if self.verbose:
-                    print(f"Filtrando apenas arquivos do tipo: {file_type_filter} ({len(target_extensions)} extensões)")
-                    print(f"Extensões aceitas: {', '.join(sorted(target_extensions))}")
-                else:
-                    print(f"Filtrando apenas arquivos do tipo: {file_type_filter} ({len(target_extensions)} extensões)")
+            # Obter informações do arquivo (já categorizado)
+            file_info = self.get_file_info(entry, parent_path, extension,
+                                           self._filter_category if target_extensions else None, file_path)
+            if file_info is None:
+                return None
             
-            # Usar rglob para busca recursiva ou glob com profundidade limitada
-            if max_depth is None:
-                files = directory.rglob('*')
-            else:
-                files = self._get_files_with_depth(directory, max_depth)
+            # Adicionar hash se solicitado
+            if include_hash:
+                file_info.hash = self.get_file_hash(file_path)
             
-            for file_path in files:
-                if file_path.is_file():
-                    # Skip files in excluded directories
-                    if self._is_path_excluded(file_path):
-                        if self.verbose:
-                            print(f"Excluindo arquivo: {file_path}")
-                        continue
-                    
-                    # Skip files that don't match the filter type
-                    if target_extensions and file_path.suffix.lower() not in target_extensions:
-                        continue
-                        
-                    try:
-                        # Obter informações do arquivo
-                        file_info = self.get_file_info(file_path)
-                        if file_info is None:
-                            continue
-                        
-                        # Adicionar hash se solicitado
-                        if include_hash:
-                            file_info['hash'] = self.get_file_hash(file_path)
-                        
-                        # Categorizar arquivo
-                        category = self.categorize_file(file_path)
-                        file_info['category'] = category
-                        
-                        # Track folder containing this file
-                        self.folders_with_files.add(str(file_path.parent))
-                        
-                        # Adicionar ao catálogo
-                        self.catalog[category].append(file_info)
-                        self.stats[category] += 1
-                        self.stats['total_files'] += 1
-                        self.stats['total_size'] += file_info['size']
+            return file_info
+            
+        except Exception as e:
+            self.errors.append(f"Erro ao processar {file_path}: {str(e)}")
+            return None
+    
+    def _add_to_catalog(self, file_info):
+        """Adiciona um arquivo ao catálogo e atualiza as estatísticas"""
+        category = file_info.category
+        
+        # Track folder containing this file
+        self.folders_with_files.add(file_info.parent_dir)
+        
+        # Adicionar ao catálogo
+        if self.sink is not None:
+            self.sink.write(file_info)
+        else:
+            self.catalog[category].append(file_info)
+        self.stats[category] += 1
+        self.stats[f'{category}_size'] += file_info.size
+        self.stats['total_files'] += 1
+        self.stats['total_size'] += file_info.size
+        
+        # Feedback de progresso
+        if self.verbose:
+            self._progress_lines.append(f"Processando: {file_info.name} ({self.stats['total_files']} arquivos)")
+            if len(self._progress_lines) >= VERBOSE_BATCH:
+                self._flush_progress()
+        elif self.stats['total_files'] >= self._next_progress:
+            self._next_progress += PROGRESS_INTERVAL
+            print(f"Processados: {self.stats['total_files']} arquivos")
+    
+    def _flush_progress(self):
+        """Escreve de uma vez as linhas de progresso acumuladas no modo verbose"""
+        if self._progress_lines:
+            sys.stdout.write('\n'.join(self._progress_lines) + '\n')
+            self._progress_lines.clear()
+    
+    def scan_directory(self, directory_path, include_hash=False, max_depth=None, file_type_filter=None):
+        """Varre um diretório recursivamente"""
+        target_extensions = self._prepare_scan(directory_path, file_type_filter)
+        if target_extensions is False:
+            return
+        # Only the root is resolved; absolute subdirectory paths are joined from it
+        root_abs = str(Path(directory_path).resolve())
+        if self._is_path_excluded(root_abs):
+            return
+        if include_hash:
+            self.stats['hash_algorithm'] = HASH_ALGORITHM
+        
+        try:
+            for name, entry, parent_path in self._walk_scandir(str(Path(directory_path)), root_abs, max_depth):
+                file_info = self._build_file_info(name, entry, parent_path, target_extensions, include_hash)
+                if file_info is not None:
+                    self._add_to_catalog(file_info)
                         
-                        # Feedback de progresso
-                        if self.verbose or self.stats['total_files'] % 1000 == 0:
-                            if self.verbose:
-                                print(f"Processando: {file_path.name} ({self.stats['total_files']} arquivos)")
-                            elif self.stats['total_files'] % 1000 == 0:
-                                print(f"Processados: {self.stats['total_files']} arquivos")
+        except Exception as e:
+            self.errors.append(f"Erro ao varrer diretório {directory_path}: {str(e)}")
+        finally:
+            self._flush_progress()
+    
+    def scan_directory_parallel(self, directory_path, include_hash=False, max_depth=None,
+                                file_type_filter=None, max_workers=32):
+        """Varre um diretório com várias threads, mantendo muitas leituras de diretório em andamento"""
+        target_extensions = self._prepare_scan(directory_path, file_type_filter)
+        if target_extensions is False:
+            return
+        # Only the root is resolved; absolute subdirectory paths are joined from it
+        root_abs = str(Path(directory_path).resolve())
+        if self._is_path_excluded(root_abs):
+            return
+        if include_hash:
+            self.stats['hash_algorithm'] = HASH_ALGORITHM
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = {executor.submit(self._scan_one_directory, str(Path(directory_path)), root_abs,
+                                           0, max_depth, target_extensions, include_hash)}
+                # Each finished directory returns its subdirectories, which are
+                # submitted in turn; the scan ends when nothing is pending
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for subdir, subdir_abs, depth in future.result():
+                            pending.add(executor.submit(self._scan_one_directory, subdir, subdir_abs,
+                                                        depth, max_depth, target_extensions, include_hash))
                             
-                    except Exception as e:
-                        self.errors.append(f"Erro ao processar {file_path}: {str(e)}")
-                        
         except Exception as e:
             self.errors.append(f"Erro ao varrer diretório {directory_path}: {str(e)}")
+        finally:
+            self._flush_progress()
     
-    def _get_files_with_depth(self, directory, max_depth):
-        """Busca arquivos com profundidade limitada"""
-        for root, dirs, files in os.walk(directory):
-            # Check if current directory should be excluded
-            root_path = Path(root).resolve()
-            if self._is_path_excluded(root_path):
-                dirs[:] = []  # Don't descend into excluded directories
-                continue
-                
-            level = root.replace(str(directory), '').count(os.sep)
-            if level >= max_depth:
-                dirs[:] = []  # Não descer mais níveis
-            for file in files:
-                yield Path(root) / file
-    
-    def _is_path_excluded(self, file_path):
-        """Verifica se um caminho deve ser excluído da busca"""
-        if not self.exclude_paths:
-            return False
-            
-        file_abs_path = file_path.resolve()
+    def _scan_one_directory(self, path, abs_path, depth, max_depth, target_extensions, include_hash):
+        """Lê um único diretório (executado nas threads); retorna os subdiretórios a visitar"""
+        descend = max_depth is None or depth < max_depth
+        # Bound once per directory; None when there is nothing to exclude
+        excluded = self._is_path_excluded if self.exclude_paths else None
+        build_file_info = self._build_file_info
+        batch = []
+        subdirs = []
+        try:
+            with _scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Excluded subtrees are pruned here, before they are ever read
+                        if descend:
+                            subdir_abs = os.path.join(abs_path, entry.name)
+                            if excluded is None or not excluded(subdir_abs):
+                                subdirs.append((os.path.join(path, entry.name), subdir_abs))
+                    elif entry.is_file():
+                        file_info = build_file_info(entry.name, entry, path, target_extensions, include_hash)
+                        if file_info is not None:
+                            batch.append(file_info)
+        except OSError as e:
+            self.errors.append(f"Erro ao acessar diretório {path}: {str(e)}")
+        
+        # Merge the whole directory at once to keep lock contention low
+        if batch:
+            with self._catalog_lock:
+                for file_info in batch:
+                    self._add_to_catalog(file_info)
         
-        # Check if the file or any of its parent directories are in exclude_paths
-        for exclude_path in self.exclude_paths:
+        return [(subdir, subdir_abs, depth + 1) for subdir, subdir_abs in subdirs]
+    
+    def _walk_scandir(self, path, abs_path, max_depth=None):
+        """Percorre o diretório com os.scandir, retornando (nome, DirEntry, pasta) de cada arquivo
+        
+        abs_path é o caminho absoluto já resolvido de path, usado nas exclusões.
+        """
+        # Explicit stack instead of recursion; each item carries its own depth
+        stack = [(path, abs_path, 0)]
+        excluded = self._is_path_excluded if self.exclude_paths else None  # None: nada a excluir
+        while stack:
+            path, abs_path, depth = stack.pop()
+            descend = max_depth is None or depth < max_depth  # Não descer além de max_depth
+            subdirs = []
             try:
-                # Check if file_abs_path is the same as or under exclude_path
-                file_abs_path.relative_to(exclude_path)
-                return True
-            except ValueError:
-                # file_abs_path is not under exclude_path
+                with _scandir(path) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Excluded subtrees are pruned here, before they are ever read
+                            if descend:
+                                subdir_abs = os.path.join(abs_path, entry.name)
+                                if excluded is None or not excluded(subdir_abs):
+                                    subdirs.append((os.path.join(path, entry.name), subdir_abs, depth + 1))
+                        elif entry.is_file():
+                            yield entry.name, entry, path
+            except OSError as e:
+                self.errors.append(f"Erro ao acessar diretório {path}: {str(e)}")
                 continue
+            
+            # Reversed so subdirectories are still visited in listing order
+            stack.extend(reversed(subdirs))
+    
+    def _is_path_excluded(self, path):
+        """Verifica se um caminho absoluto (str) deve ser excluído da busca"""
+        if not self.exclude_paths:
+            return False
         
-        return False
+        # Same as, or under, one of the excluded paths
+        return path in self._exclude_exact or path.startswith(self._exclude_prefixes)
     
     def _load_folder_exclusions(self):
         """Carrega exclusões de pastas do arquivo folder_exclusions.txt"""
@@ -227,7 +593,8 @@ class FileCataloger:
                     line = line.strip()
                     if line and not line.startswith('#'):  # Skip empty lines and comments
                         try:
-                            abs_path = Path(line).resolve()
+                            # Resolved like the scan roots, so links and mapped drives compare equal
+                            abs_path = str(Path(os.path.expanduser(line)).resolve())
                             self.exclude_paths.add(abs_path)
                             excluded_count += 1
                             if self.verbose:
@@ -246,58 +613,141 @@ class FileCataloger:
                 self.errors.append(error_msg)
                 print(f"⚠️  {error_msg}")
     
-    def save_folders_list(self, output_file='folders_with_files.txt', file_type_filter=None):
-        """Salva lista de pastas que contêm arquivos no escopo"""
+    def save_folders_list(self, output_file='folders_with_files.txt', file_type_filter=None, log=print,
+                          volumes=None):
+        """Salva lista de pastas que contêm arquivos no escopo; retorna quantas pastas são
+        
+        As mensagens vão para log (print por padrão). Os volumes e o filtro vão no cabeçalho.
+        """
         if not self.folders_with_files:
-            print("Nenhuma pasta com arquivos encontrada para salvar.")
-            return
+            log("Nenhuma pasta com arquivos encontrada para salvar.")
+            return 0
         
         # Sort folders for better readability
         sorted_folders = sorted(self.folders_with_files)
         
+        header = [
+            "# Lista de pastas contendo arquivos no escopo",
+            f"# Gerado em: {datetime.now().isoformat()}",
+        ]
+        if volumes is not None:
+            header.append(f"# Volumes: {json.dumps(_scope_volumes(volumes), ensure_ascii=False)}")
+        if file_type_filter:
+            header.append(f"# Filtro aplicado: {file_type_filter}")
+        header += [
+            f"# Total de pastas: {len(sorted_folders)}",
+            "#",
+            "# Para excluir uma pasta da busca real, copie a linha para folder_exclusions.txt",
+            "#",
+            "",
+        ]
+        
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"# Lista de pastas contendo arquivos no escopo\n")
-                f.write(f"# Gerado em: {datetime.now().isoformat()}\n")
-                if file_type_filter:
-                    f.write(f"# Filtro aplicado: {file_type_filter}\n")
-                f.write(f"# Total de pastas: {len(sorted_folders)}\n")
-                f.write(f"#\n")
-                f.write(f"# Para excluir uma pasta da busca real, copie a linha para folder_exclusions.txt\n")
-                f.write(f"#\n\n")
-                
-                for folder in sorted_folders:
-                    f.write(f"{folder}\n")
+            # Whole file assembled in memory and written at once; os.linesep keeps
+            # the line endings text mode used to produce
+            newline = os.linesep.encode()
+            buf = bytearray(newline.join(line.encode('utf-8') for line in header))
+            buf += newline
+            for folder in sorted_folders:
+                buf += folder.encode('utf-8')
+                buf += newline
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                f.write(buf)
             
-            print(f"Lista de pastas salva em: {output_file} ({len(sorted_folders)} pastas)")
+            log(f"Lista de pastas salva em: {output_file} ({len(sorted_folders)} pastas)")
             
         except Exception as e:
             error_msg = f"Erro ao salvar lista de pastas: {e}"
             self.errors.append(error_msg)
-            print(f"⚠️  {error_msg}")
+            log(f"⚠️  {error_msg}")
+        
+        return len(sorted_folders)
     
-    def scan_multiple_volumes(self, volume_paths, include_hash=False, max_depth=None, file_type_filter=None):
+    def scan_multiple_volumes(self, volume_paths, include_hash=False, max_depth=None, file_type_filter=None,
+                              workers=1, hash_workers=1):
         """Varre múltiplos volumes de rede"""
         print("Iniciando varredura de múltiplos volumes...")
         
+        # With several hash workers the files are hashed in a separate pass after the scan
+        hash_during_scan = include_hash and hash_workers <= 1
+        
         for volume_path in volume_paths:
             print(f"\n{'='*50}")
             print(f"Volume: {volume_path}")
             print(f"{'='*50}")
             
-            self.scan_directory(volume_path, include_hash, max_depth, file_type_filter)
+            if workers > 1:
+                self.scan_directory_parallel(volume_path, hash_during_scan, max_depth, file_type_filter,
+                                             max_workers=workers)
+            else:
+                self.scan_directory(volume_path, hash_during_scan, max_depth, file_type_filter)
+        
+        if include_hash and not hash_during_scan:
+            self.hash_files(hash_workers)
+    
+    def hash_files(self, workers):
+        """Calcula o hash de todos os arquivos catalogados usando vários processos"""
+        print(f"\nCalculando hashes com {workers} processos...")
+        self.stats['hash_algorithm'] = HASH_ALGORITHM
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            if self.sink is None:
+                for files in self.catalog.values():
+                    digests = pool.map(_hash_file, [f.path for f in files], chunksize=HASH_CHUNKSIZE)
+                    for file_info, digest in zip(files, digests):
+                        file_info.hash = digest
+                return
+            
+            # Streamed catalog: rewrite each category into a new sink, one batch at a time
+            old_sink, self.sink = self.sink, CatalogSink()
+            try:
+                for category in self.categories:
+                    records = old_sink.iter_category(category)
+                    while batch := list(islice(records, HASH_BATCH)):
+                        digests = pool.map(_hash_file, [f.path for f in batch], chunksize=HASH_CHUNKSIZE)
+                        for file_info, digest in zip(batch, digests):
+                            file_info.hash = digest
+                            self.sink.write(file_info)
+            finally:
+                old_sink.close()
+    
+    def iter_files(self, category=None):
+        """Percorre os arquivos catalogados (de uma categoria ou de todas), da memória ou do disco"""
+        categories = [category] if category else list(self.categories)
+        for cat in categories:
+            if self.sink is not None:
+                yield from self.sink.iter_category(cat)
+            else:
+                yield from self.catalog.get(cat, ())
+    
+    def close(self):
+        """Libera os arquivos temporários do catálogo em disco"""
+        if self.sink is not None:
+            self.sink.close()
     
     def save_catalog(self, output_file='catalog.json'):
         """Salva o catálogo em arquivo JSON"""
-        catalog_data = {
-            'timestamp': datetime.now().isoformat(),
-            'stats': dict(self.stats),
-            'catalog': dict(self.catalog),
-            'errors': self.errors
-        }
-        
+        # Written piece by piece so the catalog never has to be fully in memory
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(catalog_data, f, indent=2, ensure_ascii=False)
+            f.write('{\n')
+            f.write(f'  "timestamp": {json.dumps(datetime.now().isoformat())},\n')
+            f.write(f'  "stats": {json.dumps(dict(self.stats), ensure_ascii=False)},\n')
+            f.write('  "catalog": {')
+            first_category = True
+            for category in self.categories:
+                if not self.stats[category]:
+                    continue
+                f.write('\n' if first_category else ',\n')
+                f.write(f'    {json.dumps(category)}: [')
+                first_category = False
+                first_file = True
+                for file_info in self.iter_files(category):
+                    f.write('\n      ' if first_file else ',\n      ')
+                    f.write(json.dumps(file_info.to_json(), ensure_ascii=False))
+                    first_file = False
+                f.write('\n    ]')
+            f.write('\n  },\n')
+            f.write(f'  "errors": {json.dumps(self.errors, ensure_ascii=False)}\n')
+            f.write('}\n')
         
         print(f"Catálogo salvo em: {output_file}")
     
@@ -308,70 +758,73 @@ class FileCataloger:
             
             # Cabeçalho
             writer.writerow(['Category', 'Name', 'Path', 'Size', 'Extension', 
-                           'Modified', 'Created', 'Parent_Dir', 'Hash'])
+                           'Modified', 'Created', 'Parent_Dir', 'Hash', 'Hash_Algorithm'])
             
             # Dados
-            for category, files in self.catalog.items():
-                for file_info in files:
-                    writer.writerow([
-                        category,
-                        file_info['name'],
-                        file_info['path'],
-                        file_info['size'],
-                        file_info['extension'],
-                        file_info['modified'],
-                        file_info['created'],
-                        file_info['parent_dir'],
-                        file_info.get('hash', '')
-                    ])
+            fmt = datetime.fromtimestamp
+            for file_info in self.iter_files():
+                writer.writerow([
+                    file_info.category,
+                    file_info.name,
+                    file_info.path,
+                    file_info.size,
+                    file_info.extension,
+                    fmt(file_info.mtime).isoformat(),
+                    fmt(file_info.ctime).isoformat(),
+                    file_info.parent_dir,
+                    file_info.hash.hex() if file_info.hash is not None else '',
+                    HASH_ALGORITHM if file_info.hash is not None else ''
+                ])
         
         print(f"Catálogo CSV salvo em: {output_file}")
     
     def save_catalog_excel(self, output_file='catalog.xlsx'):
         """Salva o catálogo em formato Excel (.xlsx)"""
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Catalog"
+        # Write-only workbook: rows are streamed into the file instead of kept as cells
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Catalog")
 
         # Cabeçalho
         headers = ['Category', 'Name', 'Path', 'Size', 'Extension', 
-                   'Modified', 'Created', 'Parent_Dir', 'Hash']
+                   'Modified', 'Created', 'Parent_Dir', 'Hash', 'Hash_Algorithm']
         ws.append(headers)
 
         # Dados
-        for category, files in self.catalog.items():
-            for file_info in files:
-                ws.append([
-                    category,
-                    file_info['name'],
-                    file_info['path'],
-                    file_info['size'],
-                    file_info['extension'],
-                    file_info['modified'],
-                    file_info['created'],
-                    file_info['parent_dir'],
-                    file_info.get('hash', '')
-                ])
+        fmt = datetime.fromtimestamp
+        for file_info in self.iter_files():
+            ws.append([
+                file_info.category,
+                file_info.name,
+                file_info.path,
+                file_info.size,
+                file_info.extension,
+                fmt(file_info.mtime).isoformat(),
+                fmt(file_info.ctime).isoformat(),
+                file_info.parent_dir,
+                file_info.hash.hex() if file_info.hash is not None else '',
+                HASH_ALGORITHM if file_info.hash is not None else ''
+            ])
 
         wb.save(output_file)
         print(f"Catálogo Excel salvo em: {output_file}")
     
     def print_summary(self):
         """Exibe resumo da catalogação"""
-        print(f"\n{'='*60}")
-        print("RESUMO DA CATALOGAÇÃO")
-        print(f"{'='*60}")
-        
-        print(f"Total de arquivos: {self.stats['total_files']:,}")
-        print(f"Tamanho total: {self.format_size(self.stats['total_size'])}")
-        print(f"Erros encontrados: {len(self.errors)}")
-        
-        print(f"\nArquivos por categoria:")
-        for category in ['fotos', 'musicas', 'filmes', 'ebooks', 'documents', 'outros']:
-            count = self.stats[category]
-            if count > 0:
-                size = sum(f['size'] for f in self.catalog[category])
-                print(f"  {category.title()}: {count:,} arquivos ({self.format_size(size)})")
+        lines = [
+            f"\n{'='*60}",
+            "RESUMO DA CATALOGAÇÃO",
+            f"{'='*60}",
+            f"Total de arquivos: {self.stats['total_files']:,}",
+            f"Tamanho total: {self.format_size(self.stats['total_size'])}",
+            f"Erros encontrados: {len(self.errors)}",
+            f"\nArquivos por categoria:",
+        ]
+        for category in self.categories:
+            count = self.stats.get(category, 0)
+            if count:
+                size = self.stats[f'{category}_size']
+                lines.append(f"  {category.title()}: {count:,} arquivos ({self.format_size(size)})")
+        print('\n'.join(lines))
     
     def format_size(self, size_bytes):
         """Formata tamanho em bytes para formato legível"""
@@ -381,14 +834,20 @@ class FileCataloger:
             size_bytes /= 1024.0
         return f"{size_bytes:.1f} PB"
     
-    def organize_files(self, base_output_dir, copy_files=False, dry_run=True, file_type_filter=None, move_to_dir=None):
-        """Organiza arquivos em pastas por categoria ou move para diretório específico"""
+    def organize_files(self, base_output_dir, copy_files=False, dry_run=True, file_type_filter=None, move_to_dir=None,
+                       use_copy_file_range=False, executor=None):
+        """Organiza arquivos em pastas por categoria ou move para diretório específico
+        
+        Com use_copy_file_range as cópias são feitas no kernel (ver _kernel_copy).
+        Se um executor for informado, as cópias rodam nele em paralelo.
+        """
         # Reset operation stats
         self.operation_stats = {
             'successful_operations': 0,
             'failed_operations': 0,
             'skipped_operations': 0
         }
+        self._writable_dirs = {}  # Permissions may change between runs; cache only within one
         
         # Use move_to_dir if provided, otherwise use base_output_dir
         if move_to_dir:
@@ -420,6 +879,67 @@ class FileCataloger:
         if self.verbose:
             print(f"\nIniciando processamento de {total_files} arquivos...")
         
+        move_kinds = Counter()  # same_device -> moves attempted
+        
+        # The plan is built per category first; files are only touched afterwards
+        for category, plan in self._plan_operations(categories_to_process, base_path, move_to_dir,
+                                                    copy_files, dry_run):
+            print(f"\n{category.title()}: {len(plan)} arquivos")
+            
+            # Process all files, not just first 5
+            show_limit = len(plan) if self.verbose else 5
+            
+            # Copies may run in the executor; results still come back in plan order
+            results = None
+            if executor is not None and copy_files and not dry_run:
+                results = self._submit_copies(plan, executor, show_limit, use_copy_file_range)
+            
+            for i, (file_info, src_path, dst_path, same_device) in enumerate(plan):
+                # File processing
+                if dry_run:
+                    action = "COPIAR" if copy_files else "MOVER"
+                    if i < show_limit:
+                        print(f"  {action}: {src_path} -> {dst_path}")
+                    self.operation_stats['successful_operations'] += 1
+                else:
+                    if results is not None:
+                        success = next(results)
+                    else:
+                        if not copy_files:
+                            move_kinds[same_device] += 1
+                        success = self._process_file(src_path, dst_path, copy_files, i < show_limit, same_device,
+                                                     use_copy_file_range)
+                    if success:
+                        self.operation_stats['successful_operations'] += 1
+                    else:
+                        self.operation_stats['failed_operations'] += 1
+                
+                processed_files += 1
+                
+                # Progress update for verbose mode
+                if self.verbose and processed_files % 100 == 0:
+                    progress = (processed_files / total_files) * 100
+                    print(f"  Progresso: {processed_files}/{total_files} ({progress:.1f}%)")
+            
+            if not self.verbose and len(plan) > 5:
+                remaining = len(plan) - 5
+                print(f"  ... e mais {remaining} arquivos (processados silenciosamente)")
+        
+        if self.verbose and move_kinds:
+            print(f"\nMovimentos: {move_kinds[True]} no mesmo volume (rename), "
+                  f"{move_kinds[False]} entre volumes (cópia + remoção), "
+                  f"{move_kinds[None]} com volume desconhecido (shutil.move)")
+        
+        # Print operation summary
+        self._print_operation_summary()
+    
+    def _plan_operations(self, categories_to_process, base_path, move_to_dir, copy_files, dry_run):
+        """Gera (categoria, [(file_info, origem, destino, mesmo_dispositivo), ...]) para cada categoria
+        
+        Cria as pastas de destino e resolve nomes duplicados; nenhum arquivo é copiado ou movido aqui.
+        """
+        claimed_names = {}  # category_dir -> nomes (casefold) já ocupados
+        
         for category, files in categories_to_process:
             if not files:
                 continue
@@ -430,12 +950,21 @@ class FileCataloger:
             else:
                 category_dir = base_path / category
             
+            claimed = None
+            dst_dev = 0
+            
             # Create directory with error handling
             if not dry_run:
                 try:
                     category_dir.mkdir(parents=True, exist_ok=True)
                     if self.verbose:
                         print(f"Diretório criado/verificado: {category_dir}")
+                    # Names already in the directory, listed once (shared by all categories with --move-to)
+                    if category_dir not in claimed_names:
+                        claimed_names[category_dir] = {n.casefold() for n in os.listdir(category_dir)}
+                    claimed = claimed_names[category_dir]
+                    # Moves on the same device can go straight to os.rename
+                    dst_dev = os.stat(category_dir).st_dev if not copy_files else 0
                 except PermissionError as e:
                     error_msg = f"Erro de permissão ao criar diretório {category_dir}: {e}"
                     print(f"✗ {error_msg}")
@@ -447,121 +976,117 @@ class FileCataloger:
                     self.errors.append(error_msg)
                     continue
             
-            print(f"\n{category.title()}: {len(files)} arquivos")
-            
-            # Process all files, not just first 5
-            files_to_show = files if self.verbose else files[:5]
-            
-            for i, file_info in enumerate(files):
-                src_path = Path(file_info['path'])
-                
-                # Check if source file still exists
-                if not src_path.exists():
-                    error_msg = f"Arquivo fonte não encontrado: {src_path}"
-                    if i < len(files_to_show):
-                        print(f"  ✗ {error_msg}")
-                    self.errors.append(error_msg)
-                    self.operation_stats['failed_operations'] += 1
-                    processed_files += 1
-                    continue
-                
-                dst_path = category_dir / src_path.name
+            plan = []
+            for file_info in files:
+                # No exists() check here: a file that vanished after the scan
+                # fails in _process_file with FileNotFoundError
+                src_path = Path(file_info.path)
                 
-                # Handle duplicate names with error handling
-                counter = 1
-                original_dst_path = dst_path
-                while dst_path.exists() and not dry_run:
-                    try:
-                        stem = src_path.stem
-                        suffix = src_path.suffix
-                        dst_path = category_dir / f"{stem}_{counter}{suffix}"
+                # Handle duplicate names against the names already taken in the directory.
+                # Compared case-insensitively: on APFS/HFS+/NTFS "IMG.JPG" and "img.jpg" are the
+                # same file; on case-sensitive volumes this only costs an extra suffix
+                name = src_path.name
+                if claimed is not None:
+                    counter = 1
+                    while name.casefold() in claimed:
+                        name = f"{src_path.stem}_{counter}{src_path.suffix}"
                         counter += 1
-                    except Exception as e:
-                        error_msg = f"Erro ao gerar nome único para {src_path.name}: {e}"
-                        if i < len(files_to_show):
-                            print(f"  ✗ {error_msg}")
-                        self.errors.append(error_msg)
-                        self.operation_stats['failed_operations'] += 1
-                        processed_files += 1
-                        break
-                else:
-                    # File processing
-                    if dry_run:
-                        action = "COPIAR" if copy_files else "MOVER"
-                        if i < len(files_to_show):
-                            print(f"  {action}: {src_path} -> {dst_path}")
-                        self.operation_stats['successful_operations'] += 1
-                    else:
-                        success = self._process_file(src_path, dst_path, copy_files, i < len(files_to_show))
-                        if success:
-                            self.operation_stats['successful_operations'] += 1
-                        else:
-                            self.operation_stats['failed_operations'] += 1
-                    
-                    processed_files += 1
-                    
-                    # Progress update for verbose mode
-                    if self.verbose and processed_files % 100 == 0:
-                        progress = (processed_files / total_files) * 100
-                        print(f"  Progresso: {processed_files}/{total_files} ({progress:.1f}%)")
+                    claimed.add(name.casefold())
+                
+                # None when either device is unknown (st_dev 0, e.g. DirEntry on Windows)
+                same_device = file_info.dev == dst_dev if dst_dev and file_info.dev else None
+                plan.append((file_info, src_path, category_dir / name, same_device))
             
-            if not self.verbose and len(files) > 5:
-                remaining = len(files) - 5
-                success_count = min(5, self.operation_stats['successful_operations'])
-                print(f"  ... e mais {remaining} arquivos (processados silenciosamente)")
+            yield category, plan
+    
+    def _submit_copies(self, plan, executor, show_limit, use_copy_file_range):
+        """Envia as cópias do plano ao executor em ondas; gera o resultado de cada uma na ordem do plano
         
-        # Print operation summary
-        self._print_operation_summary()
+        No Linux as origens de cada onda são lidas antecipadamente (posix_fadvise) uma onda à frente.
+        """
+        prefetch = sys.platform == 'linux'
+        if prefetch:
+            for file_info, src_path, dst_path, same_device in plan[:ORGANIZE_WAVE]:
+                executor.submit(_prefetch, src_path)
+        
+        for start in range(0, len(plan), ORGANIZE_WAVE):
+            # Only one wave is in flight, so a huge plan never becomes a huge futures list
+            futures = [executor.submit(self._process_file, src_path, dst_path, True, start + j < show_limit,
+                                       same_device, use_copy_file_range)
+                       for j, (file_info, src_path, dst_path, same_device)
+                       in enumerate(plan[start:start + ORGANIZE_WAVE])]
+            # Queued behind this wave's copies: the next sources are warmed while it finishes,
+            # close enough to their copy not to be evicted again
+            if prefetch:
+                for file_info, src_path, dst_path, same_device in plan[start + ORGANIZE_WAVE:start + 2 * ORGANIZE_WAVE]:
+                    executor.submit(_prefetch, src_path)
+            for future in futures:
+                yield future.result()
+    
+    def _is_writable(self, directory):
+        """os.access(directory, W_OK), consultado uma vez por diretório a cada organização"""
+        writable = self._writable_dirs.get(directory)
+        if writable is None:
+            writable = self._writable_dirs[directory] = os.access(directory, os.W_OK)
+        return writable
     
-    def _process_file(self, src_path, dst_path, copy_files, show_output=True):
-        """Process a single file with comprehensive error handling"""
+    def _process_file(self, src_path, dst_path, copy_files, show_output=True, same_device=None,
+                      use_copy_file_range=False):
+        """Process a single file with comprehensive error handling
+        
+        same_device indica se origem e destino estão no mesmo volume (ver _move_file).
+        """
         try:
             # Check available space (basic check)
             if not copy_files:
                 # For move operations, check if we have write permissions
-                if not os.access(src_path.parent, os.W_OK):
+                if not self._is_writable(src_path.parent):
                     error_msg = f"Sem permissão de escrita no diretório fonte: {src_path.parent}"
                     if show_output:
-                        print(f"  ✗ {error_msg}")
+                        _print_line(f"  ✗ {error_msg}")
                     self.errors.append(error_msg)
                     return False
             
             # Check destination directory permissions
-            if not os.access(dst_path.parent, os.W_OK):
+            if not self._is_writable(dst_path.parent):
                 error_msg = f"Sem permissão de escrita no diretório destino: {dst_path.parent}"
                 if show_output:
-                    print(f"  ✗ {error_msg}")
+                    _print_line(f"  ✗ {error_msg}")
                 self.errors.append(error_msg)
                 return False
             
             # Perform the operation
             if copy_files:
                 if self.verbose and show_output:
-                    print(f"  Copiando: {src_path.name} -> {dst_path}")
-                shutil.copy2(src_path, dst_path)
+                    _print_line(f"  Copiando: {src_path.name} -> {dst_path}")
+                if use_copy_file_range:
+                    _kernel_copy(src_path, dst_path)
+                    shutil.copystat(src_path, dst_path)  # Same metadata as copy2
+                else:
+                    shutil.copy2(src_path, dst_path)
                 action_word = "copiado"
             else:
                 if self.verbose and show_output:
-                    print(f"  Movendo: {src_path.name} -> {dst_path}")
-                shutil.move(str(src_path), str(dst_path))
+                    _print_line(f"  Movendo: {src_path.name} -> {dst_path}")
+                _move_file(src_path, dst_path, same_device)
                 action_word = "movido"
             
             if show_output:
-                print(f"  ✓ {src_path.name} {action_word} com sucesso")
+                _print_line(f"  ✓ {src_path.name} {action_word} com sucesso")
             
             return True
             
         except PermissionError as e:
             error_msg = f"Erro de permissão ao processar {src_path.name}: {e}"
             if show_output:
-                print(f"  ✗ {error_msg}")
+                _print_line(f"  ✗ {error_msg}")
             self.errors.append(error_msg)
             return False
             
         except FileNotFoundError as e:
             error_msg = f"Arquivo não encontrado {src_path.name}: {e}"
             if show_output:
-                print(f"  ✗ {error_msg}")
+                _print_line(f"  ✗ {error_msg}")
             self.errors.append(error_msg)
             return False
             
@@ -574,14 +1099,14 @@ class FileCataloger:
                 error_msg = f"Erro do sistema ao processar {src_path.name}: {e}"
             
             if show_output:
-                print(f"  ✗ {error_msg}")
+                _print_line(f"  ✗ {error_msg}")
             self.errors.append(error_msg)
             return False
             
         except Exception as e:
             error_msg = f"Erro inesperado ao processar {src_path.name}: {e}"
             if show_output:
-                print(f"  ✗ {error_msg}")
+                _print_line(f"  ✗ {error_msg}")
             self.errors.append(error_msg)
             return False
     
@@ -623,9 +1148,13 @@ Exemplos de uso:
     
     # Opções de varredura
     parser.add_argument('--include-hash', action='store_true',
-                       help='Calcular hash MD5 dos arquivos (útil para detectar duplicatas)')
+                       help='Calcular hash dos arquivos, BLAKE3 ou BLAKE2b (útil para detectar duplicatas)')
     parser.add_argument('--max-depth', type=int, default=None,
                        help='Profundidade máxima para varrer diretórios (None = sem limite)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Threads para varrer diretórios em paralelo; útil em volumes de rede (padrão: 1)')
+    parser.add_argument('--hash-workers', type=int, default=1,
+                       help='Processos para calcular os hashes após a varredura, com --include-hash (padrão: 1, durante a varredura)')
     
     # Opções de organização
     parser.add_argument('--organize', action='store_true',
@@ -638,6 +1167,8 @@ Exemplos de uso:
                        help='Executar organização de fato (padrão: modo simulação)')
     parser.add_argument('--file-type', type=str, default=None,
                        help='Mover apenas arquivos de um tipo específico (fotos, filmes, musicas, ebooks, documents, outros)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count(),
+                       help='Operações de arquivo simultâneas ao organizar; ~16 para SSD/NVMe, 1-2 para HD (padrão: núcleos da CPU)')
     parser.add_argument('--move-to', type=str, default=None,
                        help='Caminho completo onde copiar os arquivos encontrados (formato: /Volume/Path)')
     
@@ -662,7 +1193,9 @@ Exemplos de uso:
     if args.output_dir:
         exclude_paths.append(args.output_dir)
     
-    cataloger = FileCataloger(verbose=args.verbose, exclude_paths=exclude_paths)
+    # Only organizing needs the whole catalog in memory; otherwise stream it to disk
+    cataloger = FileCataloger(verbose=args.verbose, exclude_paths=exclude_paths,
+                              stream_catalog=not args.organize)
     
     print("Catalogador de Arquivos por Tipo")
     print("================================")
@@ -676,14 +1209,16 @@ Exemplos de uso:
         args.volumes, 
         include_hash=args.include_hash,
         max_depth=args.max_depth,
-        file_type_filter=args.file_type
+        file_type_filter=args.file_type,
+        workers=args.workers,
+        hash_workers=args.hash_workers
     )
     
     # Exibir resumo
     cataloger.print_summary()
     
     # Salvar catálogos
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     
     if not args.no_json:
         json_file = f'{args.output_prefix}_{timestamp}.json'
@@ -693,32 +1228,71 @@ Exemplos de uso:
         excel_file = f'{args.output_prefix}_{timestamp}.xlsx'
         cataloger.save_catalog_excel(excel_file)
     
-    # Save folders list (always generate, useful for analysis)
+    # Catalog files on disk are no longer needed once the outputs are written
+    cataloger.close()
+    
+    # Save folders list (useful for analysis). It is written in the background while
+    # organizing, which only reads the catalog
     folders_file = f'folders_with_files_{timestamp}.txt'
-    cataloger.save_folders_list(folders_file, args.file_type)
+    background = ThreadPoolExecutor(max_workers=1)
+    folders_future = None
+    # A real run normally follows a reviewed dry run; its list is reused only if it was
+    # made for the same volumes and filter
+    existing_lists = glob.glob('folders_with_files_*.txt') if args.organize and args.no_dry_run else []
+    scope = (_scope_volumes(args.volumes), args.file_type or None)
+    if existing_lists and _folders_list_scope(max(existing_lists)) == scope:
+        print(f"Reutilizando lista de pastas existente: {max(existing_lists)}")
+    else:
+        # Messages are held back so they don't land in the middle of the organize output
+        folders_messages = []
+        folders_future = background.submit(cataloger.save_folders_list, folders_file, args.file_type,
+                                           folders_messages.append, args.volumes)
     
     # Organizar arquivos se solicitado
-    if args.organize:
+    if args.organize and not cataloger.folders_with_files:
+        print("\nNada para organizar: nenhum arquivo no escopo.")
+    elif args.organize:
         output_dir = args.output_dir or f"organized_files_{timestamp}"
         dry_run = not args.no_dry_run
         copy_files = not args.move
+        jobs = max(1, args.jobs or 1)
         
-        print(f"\nConfiguração da organização:")
-        print(f"  Diretório de saída: {output_dir}")
-        print(f"  Modo: {'SIMULAÇÃO' if dry_run else 'EXECUÇÃO REAL'}")
-        print(f"  Ação: {'COPIAR' if copy_files else 'MOVER'}")
-        print(f"  Modo verboso: {'ATIVADO' if args.verbose else 'DESATIVADO'}")
+        mode = 'SIMULAÇÃO' if dry_run else 'EXECUÇÃO REAL'
+        action = 'COPIAR' if copy_files else 'MOVER'
+        verbose_mode = 'ATIVADO' if args.verbose else 'DESATIVADO'
+        sys.stdout.write(
+            f"\nConfiguração da organização:\n"
+            f"  Diretório de saída: {output_dir}\n"
+            f"  Modo: {mode}\n"
+            f"  Ação: {action}\n"
+            f"  Modo verboso: {verbose_mode}\n"
+        )
         
-        if dry_run:
+        # The hint is for people at a terminal; scripted runs only get it with --verbose
+        if dry_run and (args.verbose or sys.stdout.isatty()):
             print(f"\n💡 Dica: Revise o arquivo {folders_file} e adicione pastas indesejadas ao folder_exclusions.txt antes da execução real.")
         
-        cataloger.organize_files(
-            output_dir, 
-            copy_files=copy_files,
-            dry_run=dry_run,
-            file_type_filter=args.file_type,
-            move_to_dir=args.move_to
-        )
+        # Copies are spread over a thread pool (the copy syscalls release the GIL)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            cataloger.organize_files(
+                output_dir, 
+                copy_files=copy_files,
+                dry_run=dry_run,
+                file_type_filter=args.file_type,
+                move_to_dir=args.move_to,
+                use_copy_file_range=copy_files,
+                executor=executor if jobs > 1 else None
+            )
+        
+        # Files are written without per-file syncs; flush the destination volume once at the end
+        if not dry_run:
+            _syncfs(args.move_to or output_dir)
+    
+    if folders_future is not None:
+        folders_future.result()
+        for message in folders_messages:
+            print(message)
+    background.shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file